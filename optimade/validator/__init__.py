@@ -4,19 +4,16 @@ import warnings
 
 from optimade import __api_version__, __version__
 
-from .utils import DEFAULT_CONN_TIMEOUT, DEFAULT_READ_TIMEOUT
+from .utils import DEFAULT_CACHE_TTL, DEFAULT_CONN_TIMEOUT, DEFAULT_READ_TIMEOUT
 from .validator import ImplementationValidator
 
 __all__ = ["ImplementationValidator", "validate"]
 
 
-def validate():  # pragma: no cover
+def _build_parser():
+    """Builds the argument parser for the `optimade-validator` command line tool."""
     import argparse
     import json
-    import os
-    import random
-    import sys
-    import traceback
 
     parser = argparse.ArgumentParser(
         prog="optimade-validator",
@@ -121,6 +118,27 @@ def validate():  # pragma: no cover
         help=f"Read timeout to use for each individual request (DEFAULT: {DEFAULT_READ_TIMEOUT} s)",
     )
 
+    parser.add_argument(
+        "--request-delay",
+        type=float,
+        default=0.0,
+        help=(
+            "Minimum time in seconds between consecutive requests, "
+            "to avoid triggering rate limits on the implementation (DEFAULT: 0 s)"
+        ),
+    )
+
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        default=None,
+        help=(
+            "Directory in which to cache successful responses, "
+            "avoiding repeated requests when developing against a stable implementation "
+            f"(cached responses expire after {DEFAULT_CACHE_TTL} s)"
+        ),
+    )
+
     parser.add_argument(
         "--random-seed",
         type=int,
@@ -128,7 +146,23 @@ def validate():  # pragma: no cover
         help="Set seed for random number generator for reproducible runs.",
     )
 
-    args = vars(parser.parse_args())
+    return parser
+
+
+def validate(argv: list[str] | None = None):  # pragma: no cover
+    """Runs the `optimade-validator` command line tool.
+
+    Parameters:
+        argv: The command line arguments to parse. If `None`, they are
+            read from `sys.argv`.
+
+    """
+    import os
+    import random
+    import sys
+    import traceback
+
+    args = vars(_build_parser().parse_args(argv))
 
     if os.environ.get("OPTIMADE_VERBOSITY") is not None:
         try:
@@ -169,6 +203,8 @@ def validate():  # pragma: no cover
         http_headers=args["headers"],
         timeout=args["timeout"],
         read_timeout=args["read_timeout"],
+        cache_dir=args["cache_dir"],
+        request_delay=args["request_delay"],
     )
 
     try:
@@ -176,6 +212,8 @@ def validate():  # pragma: no cover
     # catch and print internal exceptions, exiting with non-zero error code
     except Exception:
         traceback.print_exc()
+    finally:
+        validator.client.close()
 
     if validator.valid is None:
         sys.exit(2)
@@ -13,12 +13,15 @@ used by the validator. The two main features being:
 """
 
 import dataclasses
+import hashlib
 import json
+import random
 import sys
 import time
 import traceback as tb
 import urllib.parse
 from collections.abc import Callable
+from pathlib import Path
 from typing import Any
 
 import requests
@@ -39,6 +42,16 @@ from optimade.models.optimade_json import Success
 DEFAULT_CONN_TIMEOUT = 3.05
 DEFAULT_READ_TIMEOUT = 60
 DEFAULT_USER_AGENT_STRING = f"optimade-python-tools validator/{__version__}"
+# Maximum age of responses in the optional on-disk response cache
+DEFAULT_CACHE_TTL = 3600
+# Number of completed tests between progress messages in the validator log
+PROGRESS_LOG_INTERVAL = 10
+# Parameters for the exponential backoff applied when retrying requests
+BACKOFF_BASE_DELAY = 1.0
+BACKOFF_JITTER = 0.5
+BACKOFF_MAX_DELAY = 30.0
+# Separate RNG for backoff jitter, so that retries do not perturb seeded validator runs
+_BACKOFF_RNG = random.Random()
 
 
 class ResponseError(Exception):
@@ -90,6 +103,17 @@ class ValidatorResults:
     )
     verbosity: int = 0
 
+    @property
+    def total_count(self) -> int:
+        """The total number of tests registered so far, of any type."""
+        return (
+            self.success_count
+            + self.failure_count
+            + self.internal_failure_count
+            + self.optional_success_count
+            + self.optional_failure_count
+        )
+
     def add_success(self, summary: str, success_type: str | None = None):
         """Register a validation success to the results class.
 
@@ -170,6 +194,9 @@ class Client:  # pragma: no cover
         headers: dict[str, str] | None = None,
         timeout: float | None = DEFAULT_CONN_TIMEOUT,
         read_timeout: float | None = DEFAULT_READ_TIMEOUT,
+        cache_dir: Path | str | None = None,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        request_delay: float = 0.0,
     ) -> None:
         """Initialises the Client with the given `base_url` without testing
         if it is valid.
@@ -189,6 +216,14 @@ class Client:  # pragma: no cover
             headers: Dictionary of additional headers to add to every request.
             timeout: Connection timeout in seconds.
             read_timeout: Read timeout in seconds.
+            cache_dir: Optional directory in which to cache successful responses
+                on disk. Cached responses are returned without making a request,
+                which is intended for development against a stable implementation.
+            cache_ttl: Maximum age in seconds of a cached response before it is
+                requested again.
+            request_delay: Minimum time in seconds between the start of consecutive
+                requests, to keep the request rate below that accepted by the
+                implementation and avoid being rate limited in the first place.
 
         """
         self.base_url: str = base_url
@@ -200,6 +235,21 @@ class Client:  # pragma: no cover
             self.headers["User-Agent"] = DEFAULT_USER_AGENT_STRING
         self.timeout = timeout or DEFAULT_CONN_TIMEOUT
         self.read_timeout = read_timeout or DEFAULT_READ_TIMEOUT
+        # A single session is reused for all requests so that connections
+        # to the implementation are kept alive between tests; retries are
+        # handled by `get()` rather than by the adapter
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=10, pool_maxsize=10, max_retries=0
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_ttl = cache_ttl
+        self.request_delay = max(0.0, request_delay or 0.0)
+        self._last_request_time: float | None = None
 
     def get(self, request: str):
         """Makes the given request, with a number of retries if being rate limited. The
@@ -215,7 +265,8 @@ class Client:  # pragma: no cover
         Raises:
             SystemExit: if there is no response from the server, or if the URL is invalid.
             ResponseError: if the server does not respond with a non-429 status code within
-                the `MAX_RETRIES` attempts.
+                the `MAX_RETRIES` attempts, waiting between attempts according to any
+                `Retry-After` header or an exponential backoff with jitter.
 
         """
         if urllib.parse.urlparse(request, allow_fragments=True).scheme:
@@ -225,21 +276,34 @@ class Client:  # pragma: no cover
                 request = f"/{request}"
             self.last_request = f"{self.base_url}{request}"
 
-        status_code = None
+        if self.cache_dir is not None:
+            cached_response = self._read_cache(self.last_request)
+            if cached_response is not None:
+                self.response = cached_response
+                return self.response
+
         retries = 0
         errors = []
         while retries < self.max_retries:
             retries += 1
+            retry_after = None
+            self._wait_for_request_slot()
             try:
-                self.response = requests.get(
+                self.response = self._session.get(
                     self.last_request,
                     headers=self.headers,
                     timeout=(self.timeout, self.read_timeout),
                 )
 
                 status_code = self.response.status_code
-                # If we hit a 429 Too Many Requests status, then try again in 1 second
-                if status_code != 429:
+                retry_after = self._parse_retry_after(self.response)
+                # Retry if we hit a 429 Too Many Requests status, or a
+                # 503 Service Unavailable that tells us when to come back
+                if status_code != 429 and not (
+                    status_code == 503 and retry_after is not None
+                ):
+                    if status_code == 200 and self.cache_dir is not None:
+                        self._write_cache(self.last_request, self.response)
                     return self.response
 
             # If the connection times out, retry but cache the error
@@ -255,8 +319,10 @@ class Client:  # pragma: no cover
                     f"Unable to make request on {self.last_request}, did you mean http://{self.last_request}?"
                 )
 
-            # If the connection failed, or returned a 429, then wait 1 second before retrying
-            time.sleep(1)
+            # If the connection failed or we were rate limited, wait for either
+            # the time requested by the server or an exponential backoff
+            if retries < self.max_retries:
+                time.sleep(self.get_retry_delay(retries, retry_after))
 
         else:
             message = f"Hit max retries ({self.max_retries}) on request {self.last_request!r}."
@@ -265,6 +331,133 @@ class Client:  # pragma: no cover
                 message += f"\nErrors:\n\t{error_str}"
             raise ResponseError(message)
 
+    def _wait_for_request_slot(self) -> None:
+        """Sleeps until at least `request_delay` seconds have passed since
+        the previous request was made.
+
+        """
+        if self.request_delay and self._last_request_time is not None:
+            elapsed = time.monotonic() - self._last_request_time
+            if elapsed < self.request_delay:
+                time.sleep(self.request_delay - elapsed)
+        self._last_request_time = time.monotonic()
+
+    def _cache_path(self, url: str) -> Path:
+        """Returns the path of the cached response body for the given URL."""
+        key = hashlib.blake2b(url.encode()).hexdigest()[:16]
+        return self.cache_dir / key  # type: ignore[operator]
+
+    def _read_cache(self, url: str) -> requests.Response | None:
+        """Returns the cached response for the given URL, or `None` if it
+        has not been cached or the cached response has expired.
+
+        """
+        path = self._cache_path(url)
+        headers_path = path.parent / f"{path.name}.headers.json"
+        if not path.is_file() or not headers_path.is_file():
+            return None
+        if time.time() - path.stat().st_mtime > self.cache_ttl:
+            return None
+
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.url = url
+        response._content = path.read_bytes()
+        response.headers.update(json.loads(headers_path.read_text()))
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        return response
+
+    def _write_cache(self, url: str, response: requests.Response) -> None:
+        """Stores the body and headers of the given response in the cache."""
+        path = self._cache_path(url)
+        path.write_bytes(response.content)
+        (path.parent / f"{path.name}.headers.json").write_text(
+            json.dumps(dict(response.headers))
+        )
+
+    def close(self) -> None:
+        """Closes the underlying session and releases any pooled connections."""
+        self._session.close()
+
+    @staticmethod
+    def get_retry_delay(retries: int, retry_after: float | None = None) -> float:
+        """Returns the time to wait before retrying a request.
+
+        Parameters:
+            retries: The number of attempts made so far.
+            retry_after: The delay requested by the server via the
+                `Retry-After` header, if any, which takes precedence.
+
+        Returns:
+            The delay in seconds, capped at `BACKOFF_MAX_DELAY`.
+
+        """
+        if retry_after:
+            return min(BACKOFF_MAX_DELAY, retry_after)
+        delay = BACKOFF_BASE_DELAY * 2 ** (retries - 1)
+        delay *= 1 + _BACKOFF_RNG.random() * BACKOFF_JITTER
+        return min(BACKOFF_MAX_DELAY, delay)
+
+    @staticmethod
+    def _parse_retry_after(response: requests.Response) -> float | None:
+        """Returns the number of seconds requested by a `Retry-After`
+        header, given either in seconds or as an HTTP date, or `None`
+        if the header is missing or invalid.
+
+        """
+        from email.utils import parsedate_to_datetime
+
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is None:
+            return None
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            return None
+        return max(0.0, retry_at.timestamp() - time.time())
+
+
+def _get_display_request(validator: Any, request: str | None) -> str:
+    """Returns the request to display in the output of a test case: the
+    last request made by the validator's client if available, otherwise
+    the passed `request` description appended to the base URL.
+
+    """
+    display_request = None
+    try:
+        display_request = validator.client.last_request
+    except AttributeError:
+        pass
+    if display_request is None:
+        display_request = validator.base_url
+        if request is not None:
+            display_request += "/" + request
+
+    return requests.utils.requote_uri(display_request.replace("\n", ""))
+
+
+def _log_progress(validator: Any) -> None:
+    """Logs the number of completed tests every `PROGRESS_LOG_INTERVAL` tests,
+    so that progress can be followed during long validation runs.
+
+    """
+    results = validator.results
+    if results.total_count % PROGRESS_LOG_INTERVAL == 0:
+        validator._log.info(
+            "Completed %d tests: %d failed, %d internal errors, %d optional failed",
+            results.total_count,
+            results.failure_count,
+            results.internal_failure_count,
+            results.optional_failure_count,
+        )
+
 
 def test_case(test_fn: Callable[..., tuple[Any, str]]):
     """Wrapper for test case functions, which pretty-prints any errors
@@ -339,36 +532,28 @@ def test_case(test_fn: Callable[..., tuple[Any, str]]):
             if isinstance(result, (SystemExit, KeyboardInterrupt)):
                 raise result
 
-            display_request = None
-            try:
-                display_request = validator.client.last_request
-            except AttributeError:
-                pass
-            if display_request is None:
-                display_request = validator.base_url
-                if request is not None:
-                    display_request += "/" + request
-
-            request = display_request
-
             # If the result was None, return it here and ignore statuses
             if result is None:
                 return result, msg
-            display_request = requests.utils.requote_uri(request.replace("\n", ""))  # type: ignore[union-attr]
 
             if not isinstance(result, Exception):
                 if not multistage:
                     success_type = "optional" if optional else None
-                    validator.results.add_success(
-                        f"{display_request} - {msg}", success_type
-                    )
+                    # The success summary is only printed at higher verbosities,
+                    # so avoid building it otherwise
+                    summary = ""
+                    if validator.results.verbosity > 0:
+                        summary = f"{_get_display_request(validator, request)} - {msg}"
+                    validator.results.add_success(summary, success_type)
+                    _log_progress(validator)
             else:
-                message = msg.split("\n")
+                display_request = _get_display_request(validator, request)
+                message = msg
                 if validator.verbosity > 1:
                     # ValidationErrors from pydantic already include very detailed errors
                     # that get duplicated in the traceback
                     if not isinstance(result, ValidationError):
-                        message += traceback.split("\n")
+                        message += "\n" + traceback
 
                 failure_type: str | None = None
                 if isinstance(result, InternalError):
@@ -381,8 +566,9 @@ def test_case(test_fn: Callable[..., tuple[Any, str]]):
                     failure_type = "optional" if optional else None
 
                 validator.results.add_failure(
-                    summary, "\n".join(message), failure_type=failure_type
+                    summary, message, failure_type=failure_type
                 )
+                _log_progress(validator)
 
                 # set failure result to None as this is expected by other functions
                 result = None
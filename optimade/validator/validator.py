@@ -12,9 +12,12 @@ import random
 import re
 import sys
 import urllib.parse
+import weakref
+from pathlib import Path
 from typing import Any, Literal
 
 import requests
+from pydantic import ValidationError
 
 from optimade.models import DataType, EntryInfoResponse, SupportLevel
 from optimade.validator.config import VALIDATOR_CONFIG as CONF
@@ -74,6 +77,8 @@ class ImplementationValidator:
         http_headers: dict[str, str] | None = None,
         timeout: float = DEFAULT_CONN_TIMEOUT,
         read_timeout: float = DEFAULT_READ_TIMEOUT,
+        cache_dir: Path | str | None = None,
+        request_delay: float = 0.0,
     ):
         """Set up the tests to run, based on constants in this module
         for required endpoints.
@@ -104,6 +109,11 @@ class ImplementationValidator:
             http_headers: Dictionary of additional headers to add to every request.
             timeout: The connection timeout to use for all requests (in seconds).
             read_timeout: The read timeout to use for all requests (in seconds).
+            cache_dir: Optional directory in which to cache successful responses
+                between runs (only used with the default client).
+            request_delay: Minimum time between consecutive requests (in seconds),
+                used to avoid triggering rate limits on the implementation
+                (only used with the default client).
 
         """
         self.verbosity = verbosity
@@ -125,6 +135,8 @@ class ImplementationValidator:
             self.as_type_cls = CONF.response_classes_index[as_type]
         elif as_type in ("structure", "reference"):
             self.as_type_cls = CONF.response_classes[f"{as_type}s/"]
+        elif as_type.startswith(f"{CONF.info_endpoint}/"):
+            self.as_type_cls = EntryInfoResponse
         else:
             self.as_type_cls = CONF.response_classes[as_type]
 
@@ -156,6 +168,8 @@ class ImplementationValidator:
                 headers=http_headers,
                 timeout=timeout,
                 read_timeout=read_timeout,
+                cache_dir=cache_dir,
+                request_delay=request_delay,
             )
 
         self._setup_log()
@@ -177,9 +191,37 @@ class ImplementationValidator:
 
         self._test_id_by_type: dict[str, Any] = {}
         self._entry_info_by_type: dict[str, Any] = {}
+        self._json_by_response: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
 
         self.results = ValidatorResults(verbosity=self.verbosity)
 
+    def _get_json(self, response: requests.Response) -> Any:
+        """Returns the decoded JSON body of the response, which is only
+        decoded once per response however many tests inspect it.
+
+        Parameters:
+            response: The response to decode.
+
+        Raises:
+            json.JSONDecodeError: If the response body is not valid JSON.
+
+        Returns:
+            The decoded JSON.
+
+        """
+        try:
+            return self._json_by_response[response]
+        except (KeyError, TypeError):
+            pass
+
+        json_response = response.json()
+        try:
+            self._json_by_response[response] = json_response
+        except TypeError:
+            pass
+
+        return json_response
+
     def _setup_log(self):
         """Define stdout log based on given verbosity."""
         self._log = logging.getLogger("optimade").getChild("validator")
@@ -286,8 +328,9 @@ class ImplementationValidator:
         base_info = self._test_info_or_links_endpoint(info_endp)
         if not base_info:
             self._log.critical(
-                f"Unable to deserialize response from introspective {info_endp!r} endpoint. "
-                "This is required for all further validation, so the validator will now exit."
+                "Unable to deserialize response from introspective %r endpoint. "
+                "This is required for all further validation, so the validator will now exit.",
+                info_endp,
             )
             # Set valid to False to ensure error code 1 is raised at CLI
             self.valid = False
@@ -300,40 +343,20 @@ class ImplementationValidator:
         if meta.get("provider") is not None:
             self.provider_prefix = meta["provider"].get("prefix")
 
-        # Set the response class for all `/info/entry` endpoints based on `/info` response
-        self.available_json_endpoints, _ = self._get_available_endpoints(
+        # Find the entry endpoints to test from the `/info` response, in a fixed order
+        available_json_endpoints, _ = self._get_available_endpoints(
             base_info, request=info_endp
         )
-        for endp in self.available_json_endpoints:
-            self._response_classes[f"{info_endp}/{endp}"] = EntryInfoResponse
+        self.available_json_endpoints = tuple(sorted(available_json_endpoints or ()))
 
         # Run some tests on the versions endpoint
         self._log.debug("Testing versions endpoint %s", CONF.versions_endpoint)
         self._test_versions_endpoint()
         self._test_bad_version_returns_553()
 
-        # Test that entry info endpoints deserialize correctly
-        # If they do not, the corresponding entry in _entry_info_by_type
-        # is set to False, which must be checked for further validation
-        for endp in self.available_json_endpoints:
-            entry_info_endpoint = f"{info_endp}/{endp}"
-            self._log.debug("Testing expected info endpoint %s", entry_info_endpoint)
-            self._entry_info_by_type[endp] = self._test_info_or_links_endpoint(
-                entry_info_endpoint
-            )
-
-        # Test that the results from multi-entry-endpoints obey, e.g. page limits,
-        # and that all entries can be deserialized with the patched models.
-        # These methods also set the test_ids for each type of entry, which are validated
-        # in the next loop.
-        for endp in self.available_json_endpoints:
-            self._log.debug("Testing multiple entry endpoint of %s", endp)
-            self._test_multi_entry_endpoint(endp)
-
-        # Test that the single IDs scraped earlier work with the single entry endpoint
+        # Test the info, multi-entry and single-entry endpoints for each entry type
         for endp in self.available_json_endpoints:
-            self._log.debug("Testing single entry request of type %s", endp)
-            self._test_single_entry_endpoint(endp)
+            self._test_entry_endpoint(endp)
 
         # Use the _entry_info_by_type to construct filters on the relevant endpoints
         if not self.minimal:
@@ -351,6 +374,35 @@ class ImplementationValidator:
 
         self.print_summary()
 
+    def _test_entry_endpoint(self, endp: str) -> None:
+        """Runs the basic tests for a single entry type in one pass:
+        deserializing its entry info endpoint, then its multi-entry
+        endpoint, then its single-entry endpoint.
+
+        Parameters:
+            endp: The entry endpoint to test, e.g. "structures".
+
+        """
+        # Test that the entry info endpoint deserializes correctly
+        # If it does not, the corresponding entry in _entry_info_by_type
+        # is set to False, which must be checked for further validation
+        entry_info_endpoint = f"{CONF.info_endpoint}/{endp}"
+        self._log.debug("Testing expected info endpoint %s", entry_info_endpoint)
+        # All entry info endpoints share the same response class
+        self._entry_info_by_type[endp] = self._test_info_or_links_endpoint(
+            entry_info_endpoint, response_cls=EntryInfoResponse
+        )
+
+        # Test that the results from the multi-entry endpoint obey, e.g. page limits,
+        # and that all entries can be deserialized with the patched models.
+        # This also sets the test ID for this type of entry, which is validated next.
+        self._log.debug("Testing multiple entry endpoint of %s", endp)
+        self._test_multi_entry_endpoint(endp)
+
+        # Test that the single ID scraped above works with the single entry endpoint
+        self._log.debug("Testing single entry request of type %s", endp)
+        self._test_single_entry_endpoint(endp)
+
     @test_case
     def _recurse_through_endpoint(self, endp: str) -> tuple[bool | None, str]:
         """For a given endpoint (`endp`), get the entry type
@@ -518,7 +570,7 @@ class ImplementationValidator:
         response, message = self._get_endpoint(endp, multistage=True)
 
         if response:
-            data = response.json().get("data", [])
+            data = self._get_json(response).get("data", [])
             data_returned = len(data)
             if data_returned < 1:
                 return (
@@ -526,7 +578,7 @@ class ImplementationValidator:
                     "Endpoint {endp!r} returned no entries, cannot get archetypal entry or test filtering.",
                 )
 
-            archetypal_entry = response.json()["data"][
+            archetypal_entry = self._get_json(response)["data"][
                 random.randint(0, data_returned - 1)
             ]
             if "id" not in archetypal_entry:
@@ -560,8 +612,8 @@ class ImplementationValidator:
         test_query = f"{endp}?response_fields={','.join(subset_fields)}&page_limit=1"
         response, _ = self._get_endpoint(test_query, multistage=True)
 
-        if response and len(response.json()["data"]) > 0:
-            doc = response.json()["data"][0]
+        if response and len(self._get_json(response)["data"]) > 0:
+            doc = self._get_json(response)["data"][0]
             expected_fields = set(subset_fields)
             expected_fields -= CONF.top_level_non_attribute_fields
 
@@ -818,7 +870,7 @@ class ImplementationValidator:
                     f"Unable to perform mandatory query {query!r}, which raised the error: {message}"
                 )
 
-            response = response.json()
+            response = self._get_json(response)
 
             if "meta" not in response or "more_data_available" not in response["meta"]:
                 raise ResponseError(
@@ -916,7 +968,7 @@ class ImplementationValidator:
                         f"Unable to perform mandatory query {reversed_query!r}, which raised the error: {message}"
                     )
 
-                reversed_response = reversed_response.json()
+                reversed_response = self._get_json(reversed_response)
                 if (
                     "meta" not in reversed_response
                     or "more_data_available" not in reversed_response["meta"]
@@ -952,12 +1004,16 @@ class ImplementationValidator:
 
         return True, f"{prop} passed filter tests"
 
-    def _test_info_or_links_endpoint(self, request_str: str) -> Literal[False] | dict:
+    def _test_info_or_links_endpoint(
+        self, request_str: str, response_cls: Any | None = None
+    ) -> Literal[False] | dict:
         """Requests an info or links endpoint and attempts to deserialize
         the response.
 
         Parameters:
             request_str: The request to make, e.g. "links".
+            response_cls: The class to use for deserialization. If `None`,
+                the response class registered for `request_str` is used.
 
         Returns:
             `False` if the info response failed deserialization,
@@ -968,7 +1024,7 @@ class ImplementationValidator:
         if response:
             deserialized, _ = self._deserialize_response(
                 response,
-                self._response_classes[request_str],
+                response_cls or self._response_classes[request_str],
                 request=request_str,
             )
             if deserialized:
@@ -984,28 +1040,14 @@ class ImplementationValidator:
             request_str: The single entry request to make, e.g. "structures/id_1".
 
         """
-        response_cls_name = endp + "/"
-        if response_cls_name in self._response_classes:
-            response_cls = self._response_classes[response_cls_name]
-        else:
-            self._log.warning(
-                "Deserializing single entry response %s with generic response rather than defined endpoint.",
-                endp,
-            )
-            response_cls = ValidatorEntryResponseOne
-
-        response_fields = set()
-        if endp in CONF.entry_schemas:
-            response_fields = (
-                set(CONF.entry_schemas[endp].keys())
-                - CONF.top_level_non_attribute_fields
-            )
+        response_cls = self._get_response_cls(endp, single=True)
+        response_fields = self._get_response_fields(endp)
 
         if endp in self._test_id_by_type:
             test_id = self._test_id_by_type[endp]
             request_str = f"{endp}/{test_id}"
             if response_fields:
-                request_str += f"?response_fields={','.join(response_fields)}"
+                request_str += f"?response_fields={response_fields}"
             response, _ = self._get_endpoint(request_str)
             if response:
                 self._test_meta_schema_reporting(response, request_str, optional=True)
@@ -1020,26 +1062,13 @@ class ImplementationValidator:
                 "structures?filter=nsites<10"
 
         """
-        if endp in self._response_classes:
-            response_cls = self._response_classes[endp]
-        else:
-            self._log.warning(
-                "Deserializing multi entry response from %s with generic response rather than defined endpoint.",
-                endp,
-            )
-            response_cls = ValidatorEntryResponseMany
-
-        response_fields = set()
-        if endp in CONF.entry_schemas:
-            response_fields = (
-                set(CONF.entry_schemas[endp].keys())
-                - CONF.top_level_non_attribute_fields
-            )
+        response_cls = self._get_response_cls(endp, single=False)
+        response_fields = self._get_response_fields(endp)
 
         request_str = f"{endp}?page_limit={self.page_limit}"
 
         if response_fields:
-            request_str += f"&response_fields={','.join(response_fields)}"
+            request_str += f"&response_fields={response_fields}"
 
         response, _ = self._get_endpoint(request_str)
 
@@ -1057,6 +1086,52 @@ class ImplementationValidator:
                 deserialized, request=request_str
             )
 
+    def _get_response_cls(self, endp: str, single: bool) -> Any:
+        """Returns the response class to use for the given entry endpoint,
+        falling back to the generic entry responses for endpoints that
+        are not explicitly defined.
+
+        Parameters:
+            endp: The entry endpoint, e.g. "structures".
+            single: Whether to return the class for single or multi-entry
+                responses.
+
+        Returns:
+            The response class.
+
+        """
+        response_cls_name = f"{endp}/" if single else endp
+        if response_cls_name in self._response_classes:
+            return self._response_classes[response_cls_name]
+
+        self._log.warning(
+            "Deserializing %s entry response from %s with generic response rather than defined endpoint.",
+            "single" if single else "multi",
+            endp,
+        )
+        return ValidatorEntryResponseOne if single else ValidatorEntryResponseMany
+
+    def _get_response_fields(self, endp: str) -> str:
+        """Returns the comma-separated `response_fields` to request from
+        the given entry endpoint.
+
+        Parameters:
+            endp: The entry endpoint, e.g. "structures".
+
+        Returns:
+            The `response_fields` query parameter value, or an empty string
+            if the endpoint has no known schema.
+
+        """
+        response_fields: set[str] = set()
+        if endp in CONF.entry_schemas:
+            response_fields = (
+                set(CONF.entry_schemas[endp].keys())
+                - CONF.top_level_non_attribute_fields
+            )
+
+        return ",".join(response_fields)
+
     @test_case
     def _test_data_available_matches_data_returned(
         self, deserialized: Any
@@ -1251,7 +1326,7 @@ class ImplementationValidator:
     ):
         """Tests whether an endpoint responds a entries under `data`."""
         try:
-            if not response.json().get("data", []):
+            if not self._get_json(response).get("data", []):
                 raise ResponseError(
                     f"Query {request_str} did not respond with any entries under `data`. This may not consitute an error, but should be checked."
                 )
@@ -1274,7 +1349,7 @@ class ImplementationValidator:
     ):
         """Tests that the endpoint responds with a `meta->schema`."""
         try:
-            if not response.json().get("meta", {}).get("schema"):
+            if not self._get_json(response).get("meta", {}).get("schema"):
                 raise ResponseError(
                     f"Query {request_str} did not report a schema in `meta->schema` field."
                 )
@@ -1314,7 +1389,7 @@ class ImplementationValidator:
         if previous_links is None:
             previous_links = set()
         try:
-            response_json = response.json()
+            response_json = self._get_json(response)
         except (AttributeError, json.JSONDecodeError):
             raise ResponseError("Unable to test endpoint `page_limit` parameter.")
 
@@ -1426,22 +1501,77 @@ class ImplementationValidator:
         """
         if not response:
             raise ResponseError("Request failed")
-        try:
-            json_response = response.json()
-        except json.JSONDecodeError:
-            raise ResponseError(
-                f"Unable to decode response as JSON. Response: {response}"
+
+        # Only decode and pretty-print the response if it will actually be logged
+        if self._log.isEnabledFor(logging.DEBUG):
+            try:
+                json_response = self._get_json(response)
+            except json.JSONDecodeError:
+                raise ResponseError(
+                    f"Unable to decode response as JSON. Response: {response}"
+                )
+
+            self._log.debug(
+                "Deserializing %s as model %s",
+                json.dumps(json_response, indent=2),
+                response_cls,
             )
 
-        self._log.debug(
-            f"Deserializing {json.dumps(json_response, indent=2)} as model {response_cls}"
-        )
+        # Validate the raw response body directly, so that the JSON is parsed
+        # by pydantic-core without building an intermediate Python dictionary
+        try:
+            deserialized = response_cls.model_validate_json(response.content)
+        except ValidationError as exc:
+            if any(error["type"] == "json_invalid" for error in exc.errors()):
+                raise ResponseError(
+                    f"Unable to decode response as JSON. Response: {response}"
+                ) from exc
+            raise
 
         return (
-            response_cls(**json_response),
+            deserialized,
             f"deserialized correctly as object of type {response_cls}",
         )
 
+    @staticmethod
+    def _extract_entry_types(base_info: Any | dict[str, Any]) -> list[str]:
+        """Extracts the JSON entry types listed under `entry_types_by_format`
+        in the base info response.
+
+        Parameters:
+            base_info: Either the unvalidated JSON representation of the
+                base info, or the deserialized object.
+
+        Raises:
+            ResponseError: If `entry_types_by_format` or its `json` entry
+                could not be found.
+
+        Returns:
+            The list of JSON entry types.
+
+        """
+        # Walk down to `entry_types_by_format` with cheap lookups, which works
+        # on both the raw JSON and a deserialized response without raising
+        entry_types_by_format = base_info
+        for key in ("data", "attributes", "entry_types_by_format"):
+            if isinstance(entry_types_by_format, dict):
+                entry_types_by_format = entry_types_by_format.get(key)
+            else:
+                entry_types_by_format = getattr(entry_types_by_format, key, None)
+
+        if not isinstance(entry_types_by_format, dict):
+            raise ResponseError(
+                f"Unable to get entry_types_by_format from unserializable base info response {base_info}."
+            )
+
+        entry_types = entry_types_by_format.get("json")
+        if entry_types is None:
+            raise ResponseError(
+                "Unable to find any JSON entry types in entry_types_by_format"
+            )
+
+        return entry_types
+
     @test_case
     def _get_available_endpoints(
         self, base_info: Any | dict[str, Any]
@@ -1458,23 +1588,7 @@ class ImplementationValidator:
             and a string summary.
 
         """
-        available_json_entry_endpoints = []
-        for _ in [0]:
-            try:
-                available_json_entry_endpoints = base_info["data"]["attributes"][
-                    "entry_types_by_format"
-                ]["json"]
-                break
-            except (KeyError, TypeError):
-                raise ResponseError(
-                    "Unable to get entry_types_by_format from unserializable base info response {}.".format(
-                        base_info
-                    )
-                )
-        else:
-            raise ResponseError(
-                "Unable to find any JSON entry types in entry_types_by_format"
-            )
+        available_json_entry_endpoints = self._extract_entry_types(base_info)
 
         if self.index and available_json_entry_endpoints != []:
             raise ResponseError(
@@ -1528,7 +1642,7 @@ class ImplementationValidator:
             message = f"Request to '{request_str}' returned HTTP status code {response.status_code}."
             message += "\nAdditional details from implementation:"
             try:
-                for error in response.json().get("errors", []):
+                for error in self._get_json(response).get("errors", []):
                     message += f"\n  {error.get('title', 'N/A')}: {error.get('detail', 'N/A')} ({error.get('source', {}).get('pointer', 'N/A')})"
             except json.JSONDecodeError:
                 message += f"\n  Could not parse response as JSON. Content type was {response.headers.get('content-type')!r}."
@@ -64,6 +64,36 @@ def test_with_validator_json_response(
     assert validator.valid
 
 
+def test_single_entry_requested_with_scraped_id(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that each single entry endpoint is requested with the ID scraped
+    from the corresponding multi-entry endpoint.
+
+    """
+    from .utils import client_factory
+
+    client = client_factory()(server="regular", raise_server_exceptions=False)
+    requests_made = []
+    original_get = client.get
+
+    def recording_get(url, *args, **kwargs):
+        requests_made.append(str(url))
+        return original_get(url, *args, **kwargs)
+
+    monkeypatch.setattr(client, "get", recording_get)
+
+    validator = ImplementationValidator(client=client, minimal=True)
+    validator.validate_implementation()
+    assert validator.valid
+
+    for endp in validator.available_json_endpoints:
+        test_id = validator._test_id_by_type[endp]
+        assert any(
+            request.startswith(f"{endp}/{test_id}?") for request in requests_made
+        ), f"No single entry request made for {endp}/{test_id}"
+
+
 def test_as_type_with_validator(
     client: "OptimadeTestClient", capsys: pytest.CaptureFixture
 ) -> None:
@@ -75,9 +105,10 @@ def test_as_type_with_validator(
         f"{client.base_url}/references": "references",
         f"{client.base_url}/references/dijkstra1968": "reference",
         f"{client.base_url}/info": "info",
+        f"{client.base_url}/info/structures": "info/structures",
         f"{client.base_url}/links": "links",
     }
-    with patch("requests.get", Mock(side_effect=client.get)):
+    with patch("requests.Session.get", Mock(side_effect=client.get)):
         for url, as_type in test_urls.items():
             validator = ImplementationValidator(
                 base_url=url, as_type=as_type, respond_json=True
@@ -0,0 +1,59 @@
+from optimade.validator import _build_parser
+from optimade.validator.utils import DEFAULT_CONN_TIMEOUT, DEFAULT_READ_TIMEOUT
+
+
+def test_parser_defaults():
+    """Check that the validator CLI parser can be used programmatically and
+    provides the expected defaults.
+
+    """
+    args = vars(_build_parser().parse_args(["http://example.org/v1"]))
+
+    assert args == {
+        "base_url": "http://example.org/v1",
+        "verbosity": 0,
+        "json": False,
+        "as_type": None,
+        "index": False,
+        "skip_optional": False,
+        "fail_fast": False,
+        "minimal": False,
+        "page_limit": None,
+        "headers": None,
+        "timeout": DEFAULT_CONN_TIMEOUT,
+        "read_timeout": DEFAULT_READ_TIMEOUT,
+        "request_delay": 0.0,
+        "cache_dir": None,
+        "random_seed": None,
+    }
+
+
+def test_parser_options():
+    """Check that the validator CLI parser parses a full argument list."""
+    args = vars(
+        _build_parser().parse_args(
+            [
+                "http://example.org/v1",
+                "-vv",
+                "--json",
+                "--as-type",
+                "structures",
+                "--headers",
+                '{"X-Test": "1"}',
+                "--request-delay",
+                "0.5",
+                "--cache-dir",
+                "/tmp/optimade-cache",
+                "--random-seed",
+                "42",
+            ]
+        )
+    )
+
+    assert args["verbosity"] == 2
+    assert args["json"] is True
+    assert args["as_type"] == "structures"
+    assert args["headers"] == {"X-Test": "1"}
+    assert args["request_delay"] == 0.5
+    assert args["cache_dir"] == "/tmp/optimade-cache"
+    assert args["random_seed"] == 42
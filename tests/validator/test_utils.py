@@ -33,6 +33,37 @@ def test_normal_test_case():
     assert output[1] == "message"
 
 
+def test_test_case_success_output(capsys):
+    """Check that the success summary is only printed at higher verbosities."""
+    validator = ImplementationValidator(base_url="http://example.org", verbosity=0)
+    dummy_test_case(validator, ([1, 2, 3], "message"), request="test_request")
+    assert capsys.readouterr().out == "\x1b[92m\x1b[1m.\x1b[0m"
+
+    validator = ImplementationValidator(base_url="http://example.org", verbosity=1)
+    dummy_test_case(validator, ([1, 2, 3], "message"), request="test request")
+    assert "✔: http://example.org/test%20request - message" in capsys.readouterr().out
+    assert validator.results.success_count == 1
+
+
+def test_test_case_progress_logging(caplog):
+    """Check that progress is logged every `PROGRESS_LOG_INTERVAL` tests."""
+    from optimade.validator.utils import PROGRESS_LOG_INTERVAL
+
+    validator = ImplementationValidator(base_url="http://example.org", verbosity=2)
+
+    for _ in range(PROGRESS_LOG_INTERVAL - 1):
+        dummy_test_case(validator, ([1, 2, 3], "message"), request="test_request")
+    assert "Completed" not in caplog.text
+
+    dummy_test_case(
+        validator,
+        ({"test": "dict"}, "message"),
+        request="test_request",
+        raise_exception=ResponseError("Dummy error"),
+    )
+    assert f"Completed {PROGRESS_LOG_INTERVAL} tests: 1 failed" in caplog.text
+
+
 def test_optional_test_case():
     """Check test_case for optional case."""
     validator = ImplementationValidator(base_url="http://example.org", verbosity=0)
@@ -455,3 +486,141 @@ def test_versions_test_cases():
         assert validator.results.success_count == 1
         assert validator.results.failure_count == 0
         assert validator.results.optional_failure_count == num_errors
+
+
+def test_client_retry_delay():
+    """Check that the client backs off exponentially between retries,
+    deferring to any `Retry-After` header sent by the server.
+
+    """
+    from email.utils import formatdate
+
+    from requests import Response
+
+    from optimade.validator.utils import BACKOFF_JITTER, BACKOFF_MAX_DELAY, Client
+
+    for retries in (1, 2, 3):
+        delay = Client.get_retry_delay(retries)
+        assert 2 ** (retries - 1) <= delay <= 2 ** (retries - 1) * (1 + BACKOFF_JITTER)
+
+    assert Client.get_retry_delay(100) == BACKOFF_MAX_DELAY
+    assert Client.get_retry_delay(5, retry_after=2.5) == 2.5
+    assert Client.get_retry_delay(1, retry_after=1000) == BACKOFF_MAX_DELAY
+
+    response = Response()
+    assert Client._parse_retry_after(response) is None
+    response.headers["Retry-After"] = "7"
+    assert Client._parse_retry_after(response) == 7.0
+    response.headers["Retry-After"] = formatdate(usegmt=True)
+    assert Client._parse_retry_after(response) == 0.0
+    response.headers["Retry-After"] = "not a date"
+    assert Client._parse_retry_after(response) is None
+
+
+def test_get_available_endpoints():
+    """Check that the entry endpoints can be found in both the raw JSON and a
+    deserialized base info response, and that malformed responses fail.
+
+    """
+    from types import SimpleNamespace
+
+    validator = ImplementationValidator(base_url="http://example.org", verbosity=0)
+
+    base_info = {
+        "data": {
+            "attributes": {
+                "entry_types_by_format": {"json": ["structures", "custom_endpoint"]}
+            }
+        }
+    }
+    endpoints, _ = validator._get_available_endpoints(base_info)
+    assert endpoints == ["structures"]
+
+    deserialized = SimpleNamespace(
+        data=SimpleNamespace(
+            attributes=SimpleNamespace(
+                entry_types_by_format={"json": ["references", "structures"]}
+            )
+        )
+    )
+    endpoints, _ = validator._get_available_endpoints(deserialized)
+    assert endpoints == ["references", "structures"]
+    assert validator.results.failure_count == 0
+
+    for bad_base_info in ({}, {"data": []}, {"data": {"attributes": {}}}, None):
+        endpoints, _ = validator._get_available_endpoints(bad_base_info)
+        assert endpoints is None
+
+    assert validator.results.failure_count == 4
+    assert validator.results.internal_failure_count == 0
+
+
+def test_client_response_cache(tmp_path):
+    """Check that the client serves successful responses from the on-disk
+    cache, and only caches successful responses.
+
+    """
+    from unittest.mock import Mock
+
+    from requests import Response
+
+    from optimade.validator.utils import Client
+
+    def make_response(status_code):
+        response = Response()
+        response.status_code = status_code
+        response._content = b'{"data": []}'
+        response.headers["content-type"] = "application/vnd.api+json"
+        return response
+
+    client = Client("http://example.org", cache_dir=tmp_path)
+    client._session.get = Mock(return_value=make_response(200))
+
+    response = client.get("structures")
+    cached_response = client.get("structures")
+    assert client._session.get.call_count == 1
+    assert cached_response.status_code == 200
+    assert cached_response.json() == response.json() == {"data": []}
+    assert cached_response.headers["content-type"] == "application/vnd.api+json"
+
+    # Expired entries are requested again
+    client.cache_ttl = -1
+    client.get("structures")
+    assert client._session.get.call_count == 2
+
+    client = Client("http://example.org", cache_dir=tmp_path)
+    client._session.get = Mock(return_value=make_response(404))
+    client.get("references")
+    client.get("references")
+    assert client._session.get.call_count == 2
+
+
+def test_client_request_delay():
+    """Check that the client spaces out consecutive requests by `request_delay`."""
+    import time
+    from unittest.mock import Mock
+
+    from requests import Response
+
+    from optimade.validator.utils import Client
+
+    response = Response()
+    response.status_code = 200
+    response._content = b"{}"
+
+    request_times = []
+
+    def timed_get(*args, **kwargs):
+        request_times.append(time.monotonic())
+        return response
+
+    client = Client("http://example.org", request_delay=0.1)
+    client._session.get = Mock(side_effect=timed_get)
+    for _ in range(3):
+        client.get("structures")
+
+    assert len(request_times) == 3
+    assert all(
+        later - earlier >= 0.1
+        for earlier, later in zip(request_times, request_times[1:])
+    )